@@ -0,0 +1,40 @@
+#!/usr/bin/env python3
+"""
+Compile the YAML locator files into JSON siblings
+Helper.get_locators prefers the .json file when it is up to date, so the
+locators stay authored in YAML while test runs load the faster JSON
+"""
+
+import json
+import os
+import sys
+
+# Add the project root to the Python path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from src.helper import Helper
+
+
+def compile_locators(locators_path=Helper.LOCATORS_PATH):
+    """Write a .json file next to every .yaml file under locators_path"""
+    compiled = []
+    for root, _, files in os.walk(locators_path):
+        for name in files:
+            if not name.endswith((".yaml", ".yml")):
+                continue
+            yaml_path = os.path.join(root, name)
+            json_path = os.path.splitext(yaml_path)[0] + ".json"
+            with open(json_path, "w") as file:
+                json.dump(Helper._load_yaml(yaml_path), file, indent=2)
+            compiled.append(json_path)
+    return compiled
+
+
+def main():
+    for json_path in compile_locators():
+        print(f"✓ {json_path}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
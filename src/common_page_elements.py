@@ -2,12 +2,48 @@ from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 
+# Maps the locator "type" used in the YAML files to Selenium's By strategy
+_LOCATOR_MAP = {
+    "id": By.ID,
+    "xpath": By.XPATH,
+    "css": By.CSS_SELECTOR,
+    "name": By.NAME,
+    "class": By.CLASS_NAME,
+    "link_text": By.LINK_TEXT,
+    "partial_link_text": By.PARTIAL_LINK_TEXT,
+    "tag_name": By.TAG_NAME
+}
+
+# Small script used instead of get_attribute, which ships Selenium's whole
+# getAttribute atom to the browser on every call
+_GET_VALUE_SCRIPT = "return arguments[0].value;"
+# Checks a list of [by, value] pairs in one round trip
+_ELEMENTS_EXIST_SCRIPT = (
+    "return arguments[0].map(function (loc) {"
+    "  if (loc[0] === 'xpath') {"
+    "    return document.evaluate(loc[1], document, null,"
+    "        XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue !== null;"
+    "  }"
+    "  return document.querySelector(loc[1]) !== null;"
+    "});"
+)
+# Same conversions Selenium applies before sending these strategies to the browser
+_CSS_EQUIVALENTS = {
+    By.ID: '[id="{}"]',
+    By.NAME: '[name="{}"]',
+    By.CLASS_NAME: ".{}",
+    By.TAG_NAME: "{}",
+    By.CSS_SELECTOR: "{}",
+}
+
 
 class CommonPageElements:
 
     def __init__(self, driver):
         self.driver = driver
         self.wait = WebDriverWait(driver, 10)
+        # (By, value) tuples keyed by id() of the locator dictionary
+        self._normalized_locators = {}
 
     def get_page_element(self, locator):
         """
@@ -19,27 +55,10 @@ class CommonPageElements:
             print("Invalid locator format")
             return None
 
-        find_by = None
-        if locator["type"] == "id":
-            find_by = By.ID
-        elif locator["type"] == "xpath":
-            find_by = By.XPATH
-        elif locator["type"] == "css":
-            find_by = By.CSS_SELECTOR
-        elif locator["type"] == "name":
-            find_by = By.NAME
-        elif locator["type"] == "class":
-            find_by = By.CLASS_NAME
-        elif locator["type"] == "link_text":
-            find_by = By.LINK_TEXT
-        elif locator["type"] == "partial_link_text":
-            find_by = By.PARTIAL_LINK_TEXT
-        elif locator["type"] == "tag_name":
-            find_by = By.TAG_NAME
-
-        if find_by:
+        normalized = self._normalize_locator(locator)
+        if normalized:
             try:
-                return self.driver.find_element(find_by, locator["value"])
+                return self.driver.find_element(*normalized)
             except Exception as e:
                 print(f"Element not found with locator {locator}: {e}")
                 return None
@@ -57,27 +76,10 @@ class CommonPageElements:
             print("Invalid locator format")
             return []
 
-        find_by = None
-        if locator["type"] == "id":
-            find_by = By.ID
-        elif locator["type"] == "xpath":
-            find_by = By.XPATH
-        elif locator["type"] == "css":
-            find_by = By.CSS_SELECTOR
-        elif locator["type"] == "name":
-            find_by = By.NAME
-        elif locator["type"] == "class":
-            find_by = By.CLASS_NAME
-        elif locator["type"] == "link_text":
-            find_by = By.LINK_TEXT
-        elif locator["type"] == "partial_link_text":
-            find_by = By.PARTIAL_LINK_TEXT
-        elif locator["type"] == "tag_name":
-            find_by = By.TAG_NAME
-
-        if find_by:
+        normalized = self._normalize_locator(locator)
+        if normalized:
             try:
-                return self.driver.find_elements(find_by, locator["value"])
+                return self.driver.find_elements(*normalized)
             except Exception as e:
                 print(f"Elements not found with locator {locator}: {e}")
                 return []
@@ -85,24 +87,70 @@ class CommonPageElements:
             print("Invalid locator type {} for locator {}".format(locator['type'], locator['value']))
             return []
 
+    def elements_exist(self, *locators):
+        """
+        Check whether each locator matches an element, using a single script call
+        for css, xpath, id, name, class and tag_name locators
+        :param locators: Dictionaries with 'type' and 'value' keys
+        :return: List of booleans, one per locator
+        """
+        results = [False] * len(locators)
+        batched = []
+        for index, locator in enumerate(locators):
+            if not locator or not isinstance(locator, dict):
+                continue
+            normalized = self._normalize_locator(locator)
+            if not normalized:
+                continue
+            find_by, value = normalized
+            if find_by == By.XPATH:
+                batched.append((index, [By.XPATH, value]))
+            elif find_by in _CSS_EQUIVALENTS:
+                batched.append((index, [By.CSS_SELECTOR, _CSS_EQUIVALENTS[find_by].format(value)]))
+            else:
+                results[index] = bool(self.get_page_elements(locator))
+        if batched:
+            try:
+                found = self.driver.execute_script(_ELEMENTS_EXIST_SCRIPT, [loc for _, loc in batched])
+                for (index, _), exists in zip(batched, found):
+                    results[index] = bool(exists)
+            except Exception as e:
+                print(f"Exception occurred while checking elements: {e}")
+        return results
+
     def click_element(self, element):
         """
         Click an element (accepts both locator dict and WebElement)
         :param element: WebElement or locator dictionary
         """
+        if isinstance(element, dict):
+            return self.click_locator(element)
+        return self.click(element)
+
+    def click(self, element):
+        """
+        Click a WebElement
+        :param element: WebElement
+        """
         try:
-            if isinstance(element, dict):
-                # It's a locator, find the element first
-                web_element = self.get_page_element(element)
-                if web_element:
-                    web_element.click()
-                else:
-                    print(f"Could not find element to click: {element}")
-            else:
-                # It's already a WebElement
-                element.click()
+            element.click()
+        except Exception as e:
+            print("Exception occurred while clicking: {}".format(e))
+
+    def click_locator(self, locator):
+        """
+        Find an element by locator and click it
+        :param locator: Dictionary with 'type' and 'value' keys
+        """
+        try:
+            web_element = self.get_page_element(locator)
         except Exception as e:
             print("Exception occurred while clicking: {}".format(e))
+            return
+        if web_element:
+            self.click(web_element)
+        else:
+            print(f"Could not find element to click: {locator}")
 
     def enter_keys_to_element(self, element, keys):
         """
@@ -111,23 +159,40 @@ class CommonPageElements:
         :param keys: Text to send to the element
         :return: The value attribute of the element or None
         """
+        if isinstance(element, dict):
+            return self.type_into_locator(element, keys)
+        return self.type_into(element, keys)
+
+    def type_into(self, element, keys):
+        """
+        Send keys to a WebElement
+        :param element: WebElement
+        :param keys: Text to send to the element
+        :return: The value attribute of the element or None
+        """
         try:
-            if isinstance(element, dict):
-                # It's a locator, find the element first
-                web_element = self.get_page_element(element)
-                if web_element:
-                    web_element.send_keys(keys)
-                    return web_element.get_attribute("value")
-                else:
-                    print(f"Could not find element to send keys: {element}")
-                    return None
-            else:
-                # It's already a WebElement
-                element.send_keys(keys)
-                return element.get_attribute("value")
+            element.send_keys(keys)
+            return self.driver.execute_script(_GET_VALUE_SCRIPT, element)
+        except Exception as e:
+            print("Exception occurred while sending keys: {}".format(e))
+            return None
+
+    def type_into_locator(self, locator, keys):
+        """
+        Find an element by locator and send keys to it
+        :param locator: Dictionary with 'type' and 'value' keys
+        :param keys: Text to send to the element
+        :return: The value attribute of the element or None
+        """
+        try:
+            web_element = self.get_page_element(locator)
         except Exception as e:
             print("Exception occurred while sending keys: {}".format(e))
             return None
+        if web_element:
+            return self.type_into(web_element, keys)
+        print(f"Could not find element to send keys: {locator}")
+        return None
 
     def wait_for_element_to_be_clickable(self, locator, timeout=10):
         """
@@ -137,11 +202,9 @@ class CommonPageElements:
         :return: WebElement or None
         """
         try:
-            find_by = self._get_by_type(locator["type"])
-            if find_by:
-                return self.wait.until(
-                    EC.element_to_be_clickable((find_by, locator["value"]))
-                )
+            normalized = self._normalize_locator(locator)
+            if normalized:
+                return self.wait.until(EC.element_to_be_clickable(normalized))
         except Exception as e:
             print(f"Element not clickable within {timeout} seconds: {e}")
             return None
@@ -154,11 +217,9 @@ class CommonPageElements:
         :return: WebElement or None
         """
         try:
-            find_by = self._get_by_type(locator["type"])
-            if find_by:
-                return self.wait.until(
-                    EC.visibility_of_element_located((find_by, locator["value"]))
-                )
+            normalized = self._normalize_locator(locator)
+            if normalized:
+                return self.wait.until(EC.visibility_of_element_located(normalized))
         except Exception as e:
             print(f"Element not visible within {timeout} seconds: {e}")
             return None
@@ -169,15 +230,21 @@ class CommonPageElements:
         :param locator_type: String representation of locator type
         :return: By type or None
         """
-        locator_map = {
-            "id": By.ID,
-            "xpath": By.XPATH,
-            "css": By.CSS_SELECTOR,
-            "name": By.NAME,
-            "class": By.CLASS_NAME,
-            "link_text": By.LINK_TEXT,
-            "partial_link_text": By.PARTIAL_LINK_TEXT,
-            "tag_name": By.TAG_NAME
-        }
-        return locator_map.get(locator_type)
+        return _LOCATOR_MAP.get(locator_type)
+
+    def _normalize_locator(self, locator):
+        """
+        Helper method to convert a locator dictionary into a (By, value) tuple,
+        cached so repeated lookups skip the dictionary parsing
+        :param locator: Dictionary with 'type' and 'value' keys
+        :return: Tuple of By type and value or None
+        """
+        cached = self._normalized_locators.get(id(locator))
+        # the locator is kept in the entry so a reused id() cannot match
+        if cached and cached[0] is locator:
+            return cached[1]
+        find_by = _LOCATOR_MAP.get(locator["type"])
+        normalized = (find_by, locator["value"]) if find_by else None
+        self._normalized_locators[id(locator)] = (locator, normalized)
+        return normalized
 
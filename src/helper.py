@@ -1,19 +1,88 @@
+import json
 import os
+import re
+import warnings
 import yaml
 
+try:
+    # libyaml binding, much faster than the pure python loaders
+    from yaml import CSafeLoader as _Loader
+except ImportError:
+    from yaml import SafeLoader as _Loader
+
+# xpath of the form //tag[@attr='v' or contains(@attr, 'v')], which only tests
+# attributes and can be written as a (faster) css selector
+_ATTR_TEST = r"(?:@[\w-]+\s*=\s*'[^']*'|contains\(\s*@[\w-]+\s*,\s*'[^']*'\s*\))"
+_CSS_EQUIVALENT_XPATH = re.compile(
+    r"^//[\w*-]+(?:\[\s*{0}(?:\s+(?:and|or)\s+{0})*\s*\])*$".format(_ATTR_TEST)
+)
+
 
 class Helper:
 
     LOCATORS_PATH = os.path.join(os.path.dirname(__file__), "locators")
 
+    # parsed locator files keyed by absolute path, shared by all page objects
+    _CACHE = {}
+
     def __init__(self):
         pass
 
     # function to read data from file
     def get_locators(self, filename):
-        locators = {}
-        file_path = os.path.join(self.LOCATORS_PATH, filename)
+        """
+        Return the locators of a file, parsed once per session.
+        The returned dictionary is shared by every page object and must be
+        treated as read-only, page objects also cache lookups by its entries
+        :param filename: Locator file name under LOCATORS_PATH
+        :return: Dictionary of locators, empty for an empty file
+        """
+        file_path = os.path.abspath(os.path.join(self.LOCATORS_PATH, filename))
+        locators = self._CACHE.get(file_path)
+        if locators is None:
+            locators = self._load_locators(file_path) or {}
+            self._warn_slow_locators(file_path, locators)
+            self._CACHE[file_path] = locators
+        return locators
+
+    @staticmethod
+    def _load_locators(file_path):
+        """
+        Load a locator file, preferring a compiled .json sibling of the .yaml
+        file when it is not older than the yaml source
+        :param file_path: Absolute path of the yaml locator file
+        :return: Dictionary of locators
+        """
+        json_path = os.path.splitext(file_path)[0] + ".json"
+        if os.path.exists(json_path) and os.path.getmtime(json_path) >= os.path.getmtime(file_path):
+            with open(json_path, "r") as file:
+                return json.load(file)
+        return Helper._load_yaml(file_path)
+
+    @staticmethod
+    def _load_yaml(file_path):
         # load yaml file in dictionary
         with open(file_path, "r") as file:
-            locators = yaml.load(file, Loader=yaml.FullLoader)
-        return locators
+            return yaml.load(file, Loader=_Loader)
+
+    @staticmethod
+    def _warn_slow_locators(file_path, locators):
+        """
+        Warn about xpath locators that only test attributes, these have an
+        obvious css equivalent which is faster to evaluate
+        """
+        slow = [name for name, locator in (locators or {}).items()
+                if isinstance(locator, dict) and locator.get("type") == "xpath"
+                and _CSS_EQUIVALENT_XPATH.match(str(locator.get("value", "")))]
+        if not slow:
+            return
+        with open(file_path, "r") as file:
+            lines = file.read().splitlines()
+        for name in slow:
+            lineno = next((i for i, line in enumerate(lines, 1) if line.startswith(f"{name}:")), 1)
+            warnings.warn_explicit(f"Locator '{name}' only tests attributes, prefer a css locator",
+                                   UserWarning, file_path, lineno)
+
+
+# shared instance used by all page objects
+HELPER = Helper()
@@ -1,10 +1,29 @@
+import functools
 from src.common_page_elements import CommonPageElements
-from src.helper import Helper
+from src.helper import HELPER
 from selenium.webdriver.common.keys import Keys
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.common.by import By
-import time
+from selenium.common.exceptions import StaleElementReferenceException, TimeoutException
+
+
+def _retry_on_stale_search_element(method):
+    """
+    Retry a search box action once with a freshly located element when the
+    cached one has gone stale (e.g. after the page navigated)
+    """
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        try:
+            return method(self, *args, **kwargs)
+        except StaleElementReferenceException:
+            self.invalidate_search_cache()
+        try:
+            return method(self, *args, **kwargs)
+        except StaleElementReferenceException as e:
+            print(f"Search element is stale: {e}")
+            return False
+    return wrapper
 
 
 class SearchPage(CommonPageElements):
@@ -13,33 +32,56 @@ class SearchPage(CommonPageElements):
 
     def __init__(self, driver):
         super().__init__(driver)
-        self.pageHelper = Helper()
+        self.pageHelper = HELPER
         self.page_locators = self.pageHelper.get_locators(self.LOCATOR_FILE)
         self.wait = WebDriverWait(driver, 10)
+        self._search_element = None
+        # (By, value) tuples for the locators used on every search action
+        self._loc_search_box = self._locator_tuple("search-box")
+        self._loc_search_input = self._locator_tuple("search-input")
+        self._loc_search_results = self._locator_tuple("search-results")
+        self._loc_search_suggestions = self._locator_tuple("search-suggestions")
+
+    def _locator_tuple(self, name):
+        """Return the (By, value) tuple for a named locator or None if it is missing"""
+        locator = self.page_locators.get(name)
+        return self._normalize_locator(locator) if locator else None
 
     def check_search_element(self):
         """Check if search element is present and return the element"""
+        if self._search_element is None:
+            self._search_element = self._find_search_element()
+        return self._search_element if self._search_element else False
+
+    def invalidate_search_cache(self):
+        """Forget the cached search element, call after navigating to another page"""
+        self._search_element = None
+
+    def _find_search_element(self):
+        """
+        Wait for the search element on the current page, pages load eagerly so
+        it may not be in the DOM yet. The alternative search input locator is
+        polled together with the primary one, which wins when both match
+        """
+        conditions = [EC.presence_of_element_located(loc)
+                      for loc in (self._loc_search_box, self._loc_search_input) if loc]
         try:
-            ele = self.get_page_element(self.page_locators["search-box"])
-            return ele if ele else False
+            return self.wait.until(EC.any_of(*conditions))
         except:
-            # Try alternative search input locator
-            try:
-                ele = self.get_page_element(self.page_locators["search-input"])
-                return ele if ele else False
-            except:
-                return False
+            return None
 
     def enter_text_in_search_box(self, element, text):
         """Enter text in search box using element and text"""
-        self.enter_keys_to_element(element, text)
+        self.type_into(element, text)
         return True
 
-    def search_for_stock(self, stock_symbol):
+    @_retry_on_stale_search_element
+    def search_for_stock(self, stock_symbol, timeout=5):
         """
         Perform search for a stock symbol
         Args:
             stock_symbol (str): Stock symbol to search for (e.g., 'AAPL')
+            timeout (int): Seconds to wait for search results to appear
         Returns:
             bool: True if search was successful, False otherwise
         """
@@ -53,18 +95,27 @@ class SearchPage(CommonPageElements):
             search_element.clear()
             search_element.send_keys(stock_symbol)
             
-            # Press Enter to search
+            # Press Enter to search, this navigates away from the cached element
             search_element.send_keys(Keys.ENTER)
+            self.invalidate_search_cache()
             
-            # Wait a moment for the search to process
-            time.sleep(2)
+            # Wait for the search results instead of a fixed sleep
+            WebDriverWait(self.driver, timeout).until(
+                EC.presence_of_element_located(self._loc_search_results)
+            )
             
             return True
             
+        except TimeoutException:
+            print(f"Search results not displayed within {timeout} seconds")
+            return False
+        except StaleElementReferenceException:
+            raise
         except Exception as e:
             print(f"Error during search: {e}")
             return False
 
+    @_retry_on_stale_search_element
     def clear_and_search_stock(self, stock_symbol):
         """
         Clear search box and search for new stock symbol
@@ -86,13 +137,17 @@ class SearchPage(CommonPageElements):
             # Enter new search term
             search_element.send_keys(stock_symbol)
             search_element.send_keys(Keys.ENTER)
+            self.invalidate_search_cache()
             
             return True
             
+        except StaleElementReferenceException:
+            raise
         except Exception as e:
             print(f"Error during clear and search: {e}")
             return False
 
+    @_retry_on_stale_search_element
     def clear_search_box(self):
         """
         Clear the search box
@@ -107,6 +162,8 @@ class SearchPage(CommonPageElements):
             search_element.clear()
             return True
             
+        except StaleElementReferenceException:
+            raise
         except Exception as e:
             print(f"Error clearing search box: {e}")
             return False
@@ -118,17 +175,14 @@ class SearchPage(CommonPageElements):
             list: List of search result elements or empty list if none found
         """
         try:
-            results_locator = self.page_locators.get("search-results")
-            if results_locator:
-                # Wait for results to appear
-                self.wait.until(EC.presence_of_element_located(
-                    (By.CSS_SELECTOR, results_locator["value"])
-                ))
-                return self.driver.find_elements(
-                    By.CSS_SELECTOR, results_locator["value"]
+            if self._loc_search_results:
+                # Wait for results to appear, returns all matching elements
+                return self.wait.until(
+                    EC.presence_of_all_elements_located(self._loc_search_results)
                 )
             return []
         except:
+            # Timed out waiting for results or the lookup failed
             return []
 
     def verify_stock_information_displayed(self):
@@ -138,14 +192,14 @@ class SearchPage(CommonPageElements):
             bool: True if stock information is found, False otherwise
         """
         try:
-            # Check for stock price element
-            price_element = self.get_page_element(self.page_locators.get("stock-price", {}))
-            
-            # Check for stock symbol element
-            symbol_element = self.get_page_element(self.page_locators.get("stock-symbol", {}))
+            # Check for stock price and symbol elements in one call
+            price_exists, symbol_exists = self.elements_exist(
+                self.page_locators.get("stock-price", {}),
+                self.page_locators.get("stock-symbol", {})
+            )
             
             # Return True if either price or symbol is found
-            return bool(price_element or symbol_element)
+            return price_exists or symbol_exists
             
         except:
             return False
@@ -159,13 +213,9 @@ class SearchPage(CommonPageElements):
             bool: True if suggestions appear, False otherwise
         """
         try:
-            suggestions_locator = self.page_locators.get("search-suggestions")
-            if suggestions_locator:
-                element = self.wait.until(
-                    EC.presence_of_element_located(
-                        (By.CSS_SELECTOR, suggestions_locator["value"])
-                    ),
-                    timeout
+            if self._loc_search_suggestions:
+                element = WebDriverWait(self.driver, timeout).until(
+                    EC.presence_of_element_located(self._loc_search_suggestions)
                 )
                 return bool(element)
             return False
@@ -0,0 +1,17 @@
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.common.exceptions import TimeoutException
+
+
+def wait_until(driver, condition, timeout=10):
+    """
+    Wait for condition to be truthy, return False on timeout and let the
+    caller's assertion report it
+    :param driver: WebDriver instance
+    :param condition: Callable taking the driver, e.g. an expected_conditions check
+    :param timeout: Maximum time to wait in seconds
+    :return: The condition's result or False
+    """
+    try:
+        return WebDriverWait(driver, timeout).until(condition)
+    except TimeoutException:
+        return False
@@ -1,26 +1,58 @@
 import os
-import allure
 import pytest
 from selenium import webdriver
 from src.pages import Pages
 
 SCREENSHOT_PATH = os.path.join(os.path.dirname(__file__), "../screenshots")
+FINANCE_HOME_URL = "https://www.google.com/finance/"
+WINDOW_SIZE = (1920, 1080)
+
+# Resources the tests never inspect, blocked with --block-resources
+BLOCKED_URLS = ["*.png", "*.jpg", "*.jpeg", "*.gif", "*.webp", "*.woff", "*.woff2", "*.ttf", "*.mp4",
+                "*/analytics*", "*googletagmanager*"]
 
 def pytest_addoption(parser):
     parser.addoption("--browser", action="store", default="chrome", help="Type in browser type")
+    parser.addoption("--block-resources", action="store_true", default=False,
+                     help="Block images, fonts, media and analytics requests (chrome only)")
+    parser.addoption("--headless", action="store_true", default=False,
+                     help="Run the browser headless, also enabled by HEADLESS=true")
+
+def pytest_configure(config):
+    # Resolve command line options once for the whole session
+    config._browser_type = config.getoption("--browser").lower()
+    config._block_resources = config.getoption("--block-resources")
+    config._headless = config.getoption("--headless") or os.getenv("HEADLESS", "false").lower() == "true"
 
 @pytest.fixture(scope="session")
 def browser_type(request):
-    return request.config.getoption("--browser").lower()
+    return request.config._browser_type
 
-@pytest.fixture(scope="function")
-def browser(request, browser_type):
-    request.node.name = request.node.name.replace(" ", "_")
-    # Initialize ChromeDriver
+@pytest.fixture(scope="module")
+def driver_instance(request, browser_type):
+    # Initialize ChromeDriver, shared by all tests of a module to avoid paying
+    # the driver startup for every test
     if browser_type == "chrome":
-        driver = webdriver.Chrome()
+        options = webdriver.ChromeOptions()
+        # "eager" returns from get() on DOMContentLoaded instead of waiting for every
+        # subresource, page objects and tests must use explicit waits for elements
+        options.page_load_strategy = "eager"
+        # Launch at the target size instead of calling maximize_window() per test
+        options.add_argument("--window-size={},{}".format(*WINDOW_SIZE))
+        if request.config._headless:
+            options.add_argument("--headless=new")
+        driver = webdriver.Chrome(options=options)
+        if request.config._block_resources:
+            driver.execute_cdp_cmd("Network.enable", {})
+            driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": BLOCKED_URLS})
     elif browser_type == "firefox":
-        driver = webdriver.Firefox()
+        options = webdriver.FirefoxOptions()
+        options.page_load_strategy = "eager"
+        options.add_argument("--width={}".format(WINDOW_SIZE[0]))
+        options.add_argument("--height={}".format(WINDOW_SIZE[1]))
+        if request.config._headless:
+            options.add_argument("-headless")
+        driver = webdriver.Firefox(options=options)
 
     # Return the driver object at the end of setup
     yield driver
@@ -28,6 +60,20 @@ def browser(request, browser_type):
     # For cleanup, quit the driver
     driver.quit()
 
+@pytest.fixture(scope="function")
+def browser(request, driver_instance):
+    request.node.name = request.node.name.replace(" ", "_")
+    yield driver_instance
+
+    # Reset the shared driver so the next test starts from a clean state
+    driver_instance.delete_all_cookies()
+    driver_instance.get("about:blank")
+
+@pytest.fixture(scope="function")
+def finance_home(browser):
+    browser.get(FINANCE_HOME_URL)
+    return browser
+
 @pytest.fixture(scope="function")
 def get_pages_object(browser):
     pages_obj = Pages(browser)
@@ -1,6 +1,7 @@
 import allure
 import pytest
 from selenium.webdriver.common.keys import Keys
+from src.utilities.waits import wait_until
 import time
 
 
@@ -10,7 +11,7 @@ class TestE2ESearch:
     @allure.title("E2E Search Stock Symbol Test")
     @allure.description("Complete end-to-end test for searching a stock symbol and verifying results")
     @allure.severity(allure.severity_level.CRITICAL)
-    def test_e2e_search_stock_symbol(self, browser, get_pages_object):
+    def test_e2e_search_stock_symbol(self, browser, finance_home, get_pages_object):
         """
         Test end-to-end search functionality for stock symbols
         Steps:
@@ -20,10 +21,6 @@ class TestE2ESearch:
         4. Verify search results are displayed
         5. Verify stock information is shown
         """
-        with allure.step("Navigate to Google Finance"):
-            browser.get("https://www.google.com/finance/")
-            browser.maximize_window()
-            
         with allure.step("Verify search box is present"):
             search_element = get_pages_object.search.check_search_element()
             assert search_element, "Search box is not present on the page"
@@ -33,25 +30,24 @@ class TestE2ESearch:
             assert search_result, "Search operation failed"
             
         with allure.step("Verify page title contains relevant information"):
+            def title_matches(title):
+                return any(keyword in title.lower() for keyword in ["apple", "aapl", "finance"])
+
             # Wait for page to load after search
-            time.sleep(2)
+            wait_until(browser, lambda d: title_matches(d.title))
             title = browser.title
-            assert any(keyword in title.lower() for keyword in ["apple", "aapl", "finance"]), \
+            assert title_matches(title), \
                 f"Page title doesn't contain expected keywords. Title: {title}"
 
     @allure.title("E2E Search Multiple Stocks Test")
     @allure.description("Test searching for multiple different stock symbols")
     @allure.severity(allure.severity_level.NORMAL)
-    def test_e2e_search_multiple_stocks(self, browser, get_pages_object):
+    def test_e2e_search_multiple_stocks(self, browser, finance_home, get_pages_object):
         """
         Test searching for multiple stock symbols in sequence
         """
         stocks_to_search = ["GOOGL", "MSFT", "TSLA"]
         
-        with allure.step("Navigate to Google Finance"):
-            browser.get("https://www.google.com/finance/")
-            browser.maximize_window()
-            
         for stock in stocks_to_search:
             with allure.step(f"Search for {stock} stock"):
                 search_element = get_pages_object.search.check_search_element()
@@ -59,7 +55,7 @@ class TestE2ESearch:
                 
                 # Clear previous search and enter new stock
                 get_pages_object.search.clear_and_search_stock(stock)
-                time.sleep(2)
+                wait_until(browser, lambda d: stock.lower() in d.current_url.lower())
                 
                 # Verify we're on a page related to the stock
                 current_url = browser.current_url
@@ -69,21 +65,16 @@ class TestE2ESearch:
     @allure.title("E2E Search Error Handling Test")
     @allure.description("Test search functionality with invalid inputs")
     @allure.severity(allure.severity_level.MINOR)
-    def test_e2e_search_error_handling(self, browser, get_pages_object):
+    def test_e2e_search_error_handling(self, browser, finance_home, get_pages_object):
         """
         Test search functionality with invalid or non-existent stock symbols
         """
-        with allure.step("Navigate to Google Finance"):
-            browser.get("https://www.google.com/finance/")
-            browser.maximize_window()
-            
         with allure.step("Search for invalid stock symbol"):
             search_element = get_pages_object.search.check_search_element()
             assert search_element, "Search box is not present"
             
             # Search for clearly invalid stock symbol
             get_pages_object.search.search_for_stock("INVALIDSTOCK123")
-            time.sleep(2)
             
             # Verify page handles the search gracefully (no crashes)
             page_source = browser.page_source
@@ -91,8 +82,8 @@ class TestE2ESearch:
             
         with allure.step("Search with empty string"):
             get_pages_object.search.clear_search_box()
+            # search_for_stock already waits for the page to respond
             get_pages_object.search.search_for_stock("")
-            time.sleep(1)
             
             # Verify page remains functional
             current_url = browser.current_url
@@ -101,26 +92,21 @@ class TestE2ESearch:
     @allure.title("E2E Search Performance Test")
     @allure.description("Test search performance and response times")
     @allure.severity(allure.severity_level.MINOR)
-    def test_e2e_search_performance(self, browser, get_pages_object):
+    def test_e2e_search_performance(self, browser, finance_home, get_pages_object):
         """
         Test search performance by measuring response times
         """
-        with allure.step("Navigate to Google Finance"):
-            browser.get("https://www.google.com/finance/")
-            browser.maximize_window()
-            
         with allure.step("Measure search response time"):
             start_time = time.time()
             
             search_element = get_pages_object.search.check_search_element()
             assert search_element, "Search box not found"
             
-            get_pages_object.search.search_for_stock("AAPL")
-            
-            # Wait for results to load
-            time.sleep(3)
+            # search_for_stock waits for the results to load
+            search_result = get_pages_object.search.search_for_stock("AAPL")
             
             end_time = time.time()
+            assert search_result, "Search results were not displayed"
             response_time = end_time - start_time
             
             # Assert reasonable response time (less than 10 seconds)
@@ -1,13 +1,13 @@
 import allure
+from selenium.webdriver.support import expected_conditions as EC
+from src.utilities.waits import wait_until
 
 class TestSample001:
 
     @allure.title("First Test Case")
-    def test_sample_001(self, browser, get_pages_object):
+    def test_sample_001(self, browser, finance_home):
 
-        browser.get("https://www.google.com/finance/")
-        browser.maximize_window()
-        get_pages_object.search.check_search_element()
+        wait_until(browser, EC.title_contains("Google Finance"))
         assert "Google Finance - Stock Market Prices, Real-time Quotes & Business News" in browser.title, "Title is not matching"
 
 